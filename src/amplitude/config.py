@@ -56,8 +56,8 @@ class Config:
                  use_batch: bool = False,
                  server_url: Optional[str] = None,
                  storage_provider: Optional[StorageProvider] = None,
-                 plan: Plan = None,
-                 ingestion_metadata: IngestionMetadata = None):
+                 plan: Optional[Plan] = None,
+                 ingestion_metadata: Optional[IngestionMetadata] = None):
         """The constructor of Config class"""
         self.api_key: str = api_key
         self._flush_queue_size: int = flush_queue_size
@@ -72,8 +72,8 @@ class Config:
         self._url: Optional[str] = server_url
         self.storage_provider: StorageProvider = storage_provider or InMemoryStorageProvider()
         self.opt_out: bool = False
-        self.plan: Plan = plan
-        self.ingestion_metadata: IngestionMetadata = ingestion_metadata
+        self.plan: Optional[Plan] = plan
+        self.ingestion_metadata: Optional[IngestionMetadata] = ingestion_metadata
 
     def get_storage(self) -> Storage:
         """Use configured StorageProvider to create a Storage instance then return.
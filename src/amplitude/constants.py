@@ -44,6 +44,7 @@ AMP_REVENUE_EVENT = "revenue_amount"
 
 MAX_PROPERTY_KEYS = 1024
 MAX_STRING_LENGTH = 1024
+MAX_PROPERTY_DEPTH = 100
 FLUSH_QUEUE_SIZE = 200
 FLUSH_INTERVAL_MILLIS = 10000
 FLUSH_MAX_RETRIES = 12
@@ -12,10 +12,11 @@ Classes:
     IngestionMetadata: Ingestion metadata includes source name, source version.
 """
 
-import copy
 import enum
-import json
 import logging
+import sys
+from copy import deepcopy
+from itertools import repeat
 from typing import Callable, Optional, Union
 
 from amplitude import constants
@@ -27,7 +28,13 @@ PLAN_KEY_MAPPING = {
     "version": ["version", str],
     "version_id": ["versionId", str]
 }
+_PLAN_FIELDS = tuple((key, plan_key, expected_type) for key, (plan_key, expected_type) in PLAN_KEY_MAPPING.items())
 logger = logging.getLogger(constants.LOGGER_NAME)
+NUMERIC_TYPES = (float, int)
+_NUMERIC_TYPE_SET = frozenset(NUMERIC_TYPES)
+LIST_ELEMENT_TYPES = (float, int, str)
+PROPERTY_VALUE_TYPES = (bool, float, int, str, enum.Enum)
+_SCALAR_VALUE_TYPE_SET = frozenset((bool, float, int, str, type(None)))
 
 
 class Plan:
@@ -43,6 +50,8 @@ class Plan:
         get_plan_body(): return a dict object that contains tracking plan information.
     """
 
+    __slots__ = ("branch", "source", "version", "version_id")
+
     def __init__(self, branch: Optional[str] = None, source: Optional[str] = None,
                  version: Optional[str] = None, version_id: Optional[str] = None):
         """The constructor for the Plan class
@@ -65,14 +74,14 @@ class Plan:
           A dictionary with data of the tracking plan stored in Plan instance
         """
         result = {}
-        for key in PLAN_KEY_MAPPING:
-            if not self.__dict__[key]:
+        for key, plan_key, expected_type in _PLAN_FIELDS:
+            value = getattr(self, key)
+            if not value:
                 continue
-            if isinstance(self.__dict__[key], PLAN_KEY_MAPPING[key][1]):
-                result[PLAN_KEY_MAPPING[key][0]] = self.__dict__[key]
+            if type(value) is expected_type or isinstance(value, expected_type):
+                result[plan_key] = value
             else:
-                logger.error(
-                    f"{type(self).__name__}.{key} expected {PLAN_KEY_MAPPING[key][1]} but received {type(self.__dict__[key])}.")
+                logger.error("%s.%s expected %s but received %s.", type(self).__name__, key, expected_type, type(value))
         return result
 
 
@@ -80,6 +89,8 @@ INGESTION_METADATA_KEY_MAPPING = {
     "source_name": ["source_name", str],
     "source_version": ["source_version", str],
 }
+_INGESTION_METADATA_FIELDS = tuple((key, body_key, expected_type)
+                                   for key, (body_key, expected_type) in INGESTION_METADATA_KEY_MAPPING.items())
 
 
 class IngestionMetadata:
@@ -93,6 +104,8 @@ class IngestionMetadata:
         get_body(): return a dict object that contains ingestion metadata information.
     """
 
+    __slots__ = ("source_name", "source_version")
+
     def __init__(self, source_name: Optional[str] = None, source_version: Optional[str] = None):
         """The constructor for the IngestionMetadata class
 
@@ -110,14 +123,14 @@ class IngestionMetadata:
           A dictionary with data of this object instance
         """
         result = {}
-        for key in INGESTION_METADATA_KEY_MAPPING:
-            if not self.__dict__[key]:
+        for key, body_key, expected_type in _INGESTION_METADATA_FIELDS:
+            value = getattr(self, key)
+            if not value:
                 continue
-            if isinstance(self.__dict__[key], INGESTION_METADATA_KEY_MAPPING[key][1]):
-                result[INGESTION_METADATA_KEY_MAPPING[key][0]] = self.__dict__[key]
+            if type(value) is expected_type or isinstance(value, expected_type):
+                result[body_key] = value
             else:
-                logger.error(
-                    f"{type(self).__name__}.{key} expected {INGESTION_METADATA_KEY_MAPPING[key][1]} but received {type(self.__dict__[key])}.")
+                logger.error("%s.%s expected %s but received %s.", type(self).__name__, key, expected_type, type(value))
         return result
 
 
@@ -164,6 +177,46 @@ EVENT_KEY_MAPPING = {
     "partner_id": ["partner_id", str],
     "version_name": ["version_name", str]
 }
+_EVENT_KEY_TYPES = {key: value[1] for key, value in EVENT_KEY_MAPPING.items()}
+_EVENT_ATTRIBUTES = frozenset(EVENT_KEY_MAPPING).union(("event_callback",))
+_EVENT_BODY_KEYS = tuple(sorted(((key, value[0]) for key, value in EVENT_KEY_MAPPING.items()),
+                                key=lambda keys: keys[1]))
+# Interned strings are never freed on some Python versions, so only attributes with a small set of values are interned
+_INTERN_KEYS = frozenset(("platform", "os_name", "country", "language"))
+
+
+def _property_validator(key: str, expected_type: type):
+    """Create the function verifying values of an event attribute. Attributes expecting float also accept int
+        values, but not bool.
+
+    Args:
+        key (str): The event attribute name.
+        expected_type (type): The expected type of the attribute value.
+
+    Returns:
+        A function that takes a non-None value and returns True if the value is valid for the attribute.
+    """
+
+    def validate_type(value) -> bool:
+        if type(value) is expected_type or isinstance(value, expected_type):
+            return True
+        logger.error("Event property %s expected %s but received %s.", key, expected_type, type(value))
+        return False
+
+    def validate_dict(value) -> bool:
+        return validate_type(value) and is_validate_object(value)
+
+    def validate_float(value) -> bool:
+        return type(value) in _NUMERIC_TYPE_SET or validate_type(value)
+
+    if expected_type is dict:
+        return validate_dict
+    if expected_type is float:
+        return validate_float
+    return validate_type
+
+
+_PROPERTY_VALIDATORS = {key: _property_validator(key, value[1]) for key, value in EVENT_KEY_MAPPING.items()}
 
 
 class EventOptions:
@@ -219,6 +272,49 @@ class EventOptions:
         callback(code, message): Trigger callback method of the event instance.
     """
 
+    __slots__ = ("user_id", "device_id", "time", "app_version", "platform", "os_name", "os_version", "device_brand",
+                 "device_manufacturer", "device_model", "carrier", "country", "region", "city", "dma", "language",
+                 "price", "quantity", "revenue", "product_id", "revenue_type", "location_lat", "location_lng", "ip",
+                 "idfa", "idfv", "adid", "android_id", "event_id", "session_id", "insert_id", "library", "plan",
+                 "ingestion_metadata", "partner_id", "version_name", "event_callback", "__retry")
+    user_id: Optional[str]
+    device_id: Optional[str]
+    time: Optional[int]
+    app_version: Optional[str]
+    platform: Optional[str]
+    os_name: Optional[str]
+    os_version: Optional[str]
+    device_brand: Optional[str]
+    device_manufacturer: Optional[str]
+    device_model: Optional[str]
+    carrier: Optional[str]
+    country: Optional[str]
+    region: Optional[str]
+    city: Optional[str]
+    dma: Optional[str]
+    language: Optional[str]
+    price: Optional[float]
+    quantity: Optional[int]
+    revenue: Optional[float]
+    product_id: Optional[str]
+    revenue_type: Optional[str]
+    location_lat: Optional[float]
+    location_lng: Optional[float]
+    ip: Optional[str]
+    idfa: Optional[str]
+    idfv: Optional[str]
+    adid: Optional[str]
+    android_id: Optional[str]
+    event_id: Optional[int]
+    session_id: Optional[int]
+    insert_id: Optional[str]
+    library: Optional[str]
+    plan: Optional[Plan]
+    ingestion_metadata: Optional[IngestionMetadata]
+    partner_id: Optional[str]
+    version_name: Optional[str]
+    event_callback: Optional[Callable[["EventOptions", int, Optional[str]], None]]
+
     def __init__(self, user_id: Optional[str] = None,
                  device_id: Optional[str] = None,
                  time: Optional[int] = None,
@@ -256,134 +352,68 @@ class EventOptions:
                  version_name: Optional[str] = None,
                  callback=None):
         """The constructor of EventOptions class"""
-        self.user_id: Optional[str] = None
-        self.device_id: Optional[str] = None
-        self.time: Optional[int] = None
-        self.app_version: Optional[str] = None
-        self.platform: Optional[str] = None
-        self.os_name: Optional[str] = None
-        self.os_version: Optional[str] = None
-        self.device_brand: Optional[str] = None
-        self.device_manufacturer: Optional[str] = None
-        self.device_model: Optional[str] = None
-        self.carrier: Optional[str] = None
-        self.country: Optional[str] = None
-        self.region: Optional[str] = None
-        self.city: Optional[str] = None
-        self.dma: Optional[str] = None
-        self.language: Optional[str] = None
-        self.price: Optional[float] = None
-        self.quantity: Optional[int] = None
-        self.revenue: Optional[str] = None
-        self.product_id: Optional[str] = None
-        self.revenue_type: Optional[str] = None
-        self.location_lat: Optional[float] = None
-        self.location_lng: Optional[float] = None
-        self.ip: Optional[str] = None
-        self.idfa: Optional[str] = None
-        self.idfv: Optional[str] = None
-        self.adid: Optional[str] = None
-        self.android_id: Optional[str] = None
-        self.event_id: Optional[int] = None
-        self.session_id: Optional[int] = None
-        self.insert_id: Optional[str] = None
-        self.library: Optional[str] = None
-        self.plan: Optional[Plan] = None
-        self.ingestion_metadata: Optional[IngestionMetadata] = None
-        self.partner_id: Optional[str] = None
-        self.version_name: Optional[str] = None
-        self["user_id"] = user_id
-        self["device_id"] = device_id
-        self["time"] = time
-        self["app_version"] = app_version
-        self["platform"] = platform
-        self["os_name"] = os_name
-        self["os_version"] = os_version
-        self["device_brand"] = device_brand
-        self["device_manufacturer"] = device_manufacturer
-        self["device_model"] = device_model
-        self["carrier"] = carrier
-        self["country"] = country
-        self["region"] = region
-        self["city"] = city
-        self["dma"] = dma
-        self["language"] = language
-        self["price"] = price
-        self["quantity"] = quantity
-        self["revenue"] = revenue
-        self["product_id"] = product_id
-        self["revenue_type"] = revenue_type
-        self["location_lat"] = location_lat
-        self["location_lng"] = location_lng
-        self["ip"] = ip
-        self["idfa"] = idfa
-        self["idfv"] = idfv
-        self["adid"] = adid
-        self["android_id"] = android_id
-        self["event_id"] = event_id
-        self["session_id"] = session_id
-        self["insert_id"] = insert_id
-        self["plan"] = plan
-        self["ingestion_metadata"] = ingestion_metadata
-        self["partner_id"] = partner_id
-        self["version_name"] = version_name
-        self.event_callback: Optional[Callable[[EventOptions, int, Optional[str]], None]] = callback
-        self.__retry: int = 0
+        _init_event_options(self, user_id, device_id, time, app_version, platform, os_name, os_version, device_brand,
+                            device_manufacturer, device_model, carrier, country, region, city, dma, language, price,
+                            quantity, revenue, product_id, revenue_type, location_lat, location_lng, ip, idfa, idfv,
+                            adid, android_id, event_id, session_id, insert_id, plan, ingestion_metadata, partner_id,
+                            version_name, callback)
 
     def __getitem__(self, item: str):
-        if item in self.__dict__:
-            return self.__dict__[item]
+        if item in _EVENT_ATTRIBUTES:
+            return getattr(self, item, None)
         return None
 
     def __setitem__(self, key: str, value: Union[str, float, int, dict, Plan]) -> None:
-        if self._verify_property(key, value):
-            self.__dict__[key] = value
+        if value is None:
+            if key in _EVENT_ATTRIBUTES and hasattr(self, key):
+                setattr(self, key, None)
+        elif self._verify_property(key, value):
+            if key in _INTERN_KEYS and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
 
     def __contains__(self, item: str) -> bool:
-        if item not in self.__dict__:
+        if item not in _EVENT_ATTRIBUTES:
             return False
-        return self.__dict__[item] is not None
+        return getattr(self, item, None) is not None
 
     def __str__(self) -> str:
-        return json.dumps(self.get_event_body(), sort_keys=True, skipkeys=True)
+        return utils.json_dumps(self.get_event_body())
 
     def get_event_body(self) -> dict:
         """Convert the event instance to a dict instance
 
         Returns:
-          A dictionary with the attributes and values of the event.
+          A dictionary with the attributes and values of the event, with keys inserted in sorted order.
         """
 
         event_body = {}
-        for key, value in EVENT_KEY_MAPPING.items():
-            if key in self and self[key] is not None:
-                event_body[value[0]] = self[key]
-        if "plan" in event_body:
-            event_body["plan"] = event_body["plan"].get_plan_body()
-        if "ingestion_metadata" in event_body:
-            event_body["ingestion_metadata"] = event_body["ingestion_metadata"].get_body()
-        for properties in ["user_properties", "event_properties", "group_properties"]:
-            if properties in event_body:
-                for key, value in list(event_body[properties].items()):
+        for key, body_key in _EVENT_BODY_KEYS:
+            value = getattr(self, key, None)
+            if value is not None:
+                event_body[body_key] = value
+        if self.plan is not None:
+            event_body["plan"] = self.plan.get_plan_body()
+        if self.ingestion_metadata is not None:
+            event_body["ingestion_metadata"] = self.ingestion_metadata.get_body()
+        for properties in ("user_properties", "event_properties", "group_properties"):
+            properties_value = event_body.get(properties)
+            if properties_value is not None:
+                for key, value in list(properties_value.items()):
                     if isinstance(value, enum.Enum):
-                        event_body[properties][key] = value.value
+                        properties_value[key] = value.value
                     if value is None:
-                        event_body[properties].pop(key)
+                        properties_value.pop(key)
         return utils.truncate(event_body)
 
     def _verify_property(self, key, value) -> bool:
         if value is None:
             return True
-        if key not in self.__dict__:
-            logger.error(f"Unexpected event property key: {key}")
-            return False
-        if not isinstance(value, EVENT_KEY_MAPPING[key][1]):
-            logger.error(
-                f"Event property {key} expected {EVENT_KEY_MAPPING[key][1]} but received {type(value)}.")
+        validator = _PROPERTY_VALIDATORS.get(key)
+        if validator is None or not hasattr(type(self), key):
+            logger.error("Unexpected event property key: %s", key)
             return False
-        if isinstance(value, dict):
-            return is_validate_object(value)
-        return True
+        return validator(value)
 
     def callback(self, status_code: int, message=None) -> None:
         """Trigger the event level callback method.
@@ -392,8 +422,13 @@ class EventOptions:
             status_code (int): The status code of the http api response.
             message (str, optional): A string message.
         """
-        if callable(self.event_callback):
-            self.event_callback(self, status_code, message)
+        event_callback = self.event_callback
+        if event_callback is not None:
+            event_callback(self, status_code, message)
+
+    def __reduce__(self):
+        values = tuple(getattr(self, name, None) for name in _slot_names(type(self)))
+        return _restore_event, (type(self), values), getattr(self, "__dict__", None)
 
     @property
     def retry(self):
@@ -458,6 +493,13 @@ class BaseEvent(EventOptions):
         load_event_options(event_options): Update event instance with values in input EventOptions instance
     """
 
+    __slots__ = ("event_type", "event_properties", "user_properties", "groups", "group_properties")
+    event_type: str
+    event_properties: Optional[dict]
+    user_properties: Optional[dict]
+    groups: Optional[dict]
+    group_properties: Optional[dict]
+
     def __init__(self, event_type: str,
                  user_id: Optional[str] = None,
                  device_id: Optional[str] = None,
@@ -499,50 +541,11 @@ class BaseEvent(EventOptions):
                  partner_id: Optional[str] = None,
                  callback: Optional[Callable[[EventOptions, int, Optional[str]], None]] = None):
         """The constructor of the BaseEvent class"""
-        super().__init__(user_id=user_id,
-                         device_id=device_id,
-                         time=time,
-                         app_version=app_version,
-                         platform=platform,
-                         os_name=os_name,
-                         os_version=os_version,
-                         device_brand=device_brand,
-                         device_manufacturer=device_manufacturer,
-                         device_model=device_model,
-                         carrier=carrier,
-                         country=country,
-                         region=region,
-                         city=city,
-                         dma=dma,
-                         language=language,
-                         price=price,
-                         quantity=quantity,
-                         revenue=revenue,
-                         product_id=product_id,
-                         revenue_type=revenue_type,
-                         location_lat=location_lat,
-                         location_lng=location_lng,
-                         ip=ip,
-                         idfa=idfa,
-                         idfv=idfv,
-                         adid=adid,
-                         android_id=android_id,
-                         event_id=event_id,
-                         session_id=session_id,
-                         insert_id=insert_id,
-                         plan=plan,
-                         ingestion_metadata=ingestion_metadata,
-                         partner_id=partner_id,
-                         callback=callback)
-        self.event_type: str = event_type
-        self.event_properties: Optional[dict] = None
-        self.user_properties: Optional[dict] = None
-        self.groups: Optional[dict] = None
-        self.group_properties: Optional[dict] = None
-        self["event_properties"] = event_properties
-        self["user_properties"] = user_properties
-        self["groups"] = groups
-        self["group_properties"] = group_properties
+        _init_base_event(self, event_type, user_id, device_id, time, event_properties, user_properties, groups,
+                         group_properties, app_version, platform, os_name, os_version, device_brand,
+                         device_manufacturer, device_model, carrier, country, region, city, dma, language, price,
+                         quantity, revenue, product_id, revenue_type, location_lat, location_lng, ip, idfa, idfv, adid,
+                         android_id, event_id, session_id, insert_id, plan, ingestion_metadata, partner_id, callback)
 
     def load_event_options(self, event_options: EventOptions):
         """Update event instance with values in input EventOptions instance. Existing values will be overwritten.
@@ -552,9 +555,121 @@ class BaseEvent(EventOptions):
         """
         if not event_options:
             return
-        for key in EVENT_KEY_MAPPING:
-            if key in event_options:
-                self[key] = copy.deepcopy(event_options[key])
+        for key, validator in _PROPERTY_VALIDATORS.items():
+            value = getattr(event_options, key, None)
+            if value is not None and validator(value):
+                setattr(self, key, deepcopy(value))
+
+
+_EVENT_OPTIONS_ARGS = ("user_id", "device_id", "time", "app_version", "platform", "os_name", "os_version",
+                       "device_brand", "device_manufacturer", "device_model", "carrier", "country", "region", "city",
+                       "dma", "language", "price", "quantity", "revenue", "product_id", "revenue_type", "location_lat",
+                       "location_lng", "ip", "idfa", "idfv", "adid", "android_id", "event_id", "session_id",
+                       "insert_id", "plan", "ingestion_metadata", "partner_id", "version_name", "callback")
+_BASE_EVENT_ARGS = ("user_id", "device_id", "time", "event_properties", "user_properties", "groups",
+                    "group_properties", "app_version", "platform", "os_name", "os_version", "device_brand",
+                    "device_manufacturer", "device_model", "carrier", "country", "region", "city", "dma", "language",
+                    "price", "quantity", "revenue", "product_id", "revenue_type", "location_lat", "location_lng", "ip",
+                    "idfa", "idfv", "adid", "android_id", "event_id", "session_id", "insert_id", "plan",
+                    "ingestion_metadata", "partner_id", "callback")
+
+
+_SLOT_NAMES = {}
+
+
+def _slot_names(event_cls: type) -> tuple:
+    """Return the names of the slots of an event class and its base classes, in method resolution order from the
+        base class. Private names are mangled. Computed once per class.
+
+    Args:
+        event_cls (type): The event class.
+
+    Returns:
+        The tuple of slot names
+    """
+    names = _SLOT_NAMES.get(event_cls)
+    if names is None:
+        names = []
+        for cls in reversed(event_cls.__mro__):
+            slots = cls.__dict__.get("__slots__", ())
+            for slot in ((slots,) if isinstance(slots, str) else slots):
+                if slot in ("__dict__", "__weakref__"):
+                    continue
+                if slot.startswith("__") and not slot.endswith("__"):
+                    slot = f"_{cls.__name__.lstrip('_')}{slot}"
+                names.append(slot)
+        names = _SLOT_NAMES[event_cls] = tuple(names)
+    return names
+
+
+def _event_initializer(name: str, event_cls: type, args: tuple):
+    """Generate a straight-line function that initializes all attributes of an event instance. Each attribute is
+        stored once: attributes without an argument are set to None, arguments are type checked inline and stored,
+        or replaced by None if invalid. Arguments that don't have the exact expected type, and dict arguments, are
+        verified by _verify_property. Values of _INTERN_KEYS are interned. A callback that is not callable is stored
+        as None.
+
+    Args:
+        name (str): Name of the generated function.
+        event_cls (type): The event class whose attributes are initialized.
+        args (tuple): Names of the arguments of the generated function, after self. Must end with "callback".
+
+    Returns:
+        The generated function
+    """
+    attributes = [key for key in _slot_names(event_cls) if key in _EVENT_KEY_TYPES]
+    lines = [f"def {name}(self, {', '.join(args)}):"]
+    lines.extend(f"    self.{key} = None" for key in attributes if key not in args)
+    for arg in args:
+        if arg == "event_type":
+            lines.append("    self.event_type = event_type")
+        elif arg != "callback":
+            expected_type = _EVENT_KEY_TYPES[arg]
+            verify = f"self._verify_property({arg!r}, {arg})"
+            if expected_type is dict:
+                lines.append(f"    if {arg} is not None and not {verify}:")
+                lines.append(f"        {arg} = None")
+            elif arg in _INTERN_KEYS:
+                lines.append(f"    if {arg} is not None:")
+                lines.append(f"        if type({arg}) is {expected_type.__name__}:")
+                lines.append(f"            {arg} = intern({arg})")
+                lines.append(f"        elif not {verify}:")
+                lines.append(f"            {arg} = None")
+            else:
+                if expected_type is float:
+                    type_check = f"type({arg}) not in _NUMERIC_TYPE_SET"
+                else:
+                    type_check = f"type({arg}) is not {expected_type.__name__}"
+                lines.append(f"    if {arg} is not None and {type_check} and not {verify}:")
+                lines.append(f"        {arg} = None")
+            lines.append(f"    self.{arg} = {arg}")
+    lines.append("    self.event_callback = callback if callable(callback) else None")
+    lines.append("    self._EventOptions__retry = 0")
+    namespace = {"Plan": Plan, "IngestionMetadata": IngestionMetadata, "intern": sys.intern,
+                 "_NUMERIC_TYPE_SET": _NUMERIC_TYPE_SET, "__name__": __name__}
+    exec("\n".join(lines) + "\n", namespace)
+    return namespace[name]
+
+
+def _restore_event(event_cls: type, values: tuple):
+    """Recreate an event instance from the slot values returned by EventOptions.__reduce__, without running the
+        constructor.
+
+    Args:
+        event_cls (type): The class of the event.
+        values (tuple): Values of the slots of event_cls, in the order given by _slot_names.
+
+    Returns:
+        The event instance
+    """
+    event = event_cls.__new__(event_cls)
+    for name, value in zip(_slot_names(event_cls), values):
+        object.__setattr__(event, name, value)
+    return event
+
+
+_init_event_options = _event_initializer("_init_event_options", EventOptions, _EVENT_OPTIONS_ARGS)
+_init_base_event = _event_initializer("_init_base_event", BaseEvent, ("event_type",) + _BASE_EVENT_ARGS)
 
 
 class Identify:
@@ -580,6 +695,8 @@ class Identify:
         is_valid(): True if user_properties of Identify instance is not empty
     """
 
+    __slots__ = ("_properties_set", "_properties")
+
     def __init__(self):
         """The constructor of Identify class"""
         self._properties_set = set()
@@ -587,7 +704,7 @@ class Identify:
 
     @property
     def user_properties(self):
-        return copy.deepcopy(self._properties)
+        return deepcopy(self._properties)
 
     def set(self, key: str, value: Union[int, float, str, list, dict, bool]):
         """Set the value of a property
@@ -728,9 +845,7 @@ class Identify:
 
     def _set_user_property(self, operation, key, value):
         if self._validate(operation, key, value):
-            if operation not in self._properties:
-                self._properties[operation] = {}
-            self._properties[operation][key] = value
+            self._properties.setdefault(operation, {})[key] = value
             self._properties_set.add(key)
 
     def _validate(self, operation, key, value):
@@ -738,13 +853,25 @@ class Identify:
             logger.error("Key or clear all operation already set.")
             return False
         if operation == constants.IDENTITY_OP_ADD:
-            return isinstance(value, (float, int))
+            return isinstance(value, NUMERIC_TYPES)
         if operation != constants.IDENTITY_OP_UNSET:
             return is_validate_properties(key, value)
         return True
 
 
-class GroupIdentifyEvent(BaseEvent):
+class _IdentifyTargetEvent(BaseEvent):
+    """Base class of events that load the operations of an Identify instance into the properties attribute named
+        by _IDENTIFY_TARGET.
+    """
+
+    __slots__ = ()
+    _IDENTIFY_TARGET = "user_properties"
+
+    def _load_identify(self, identify_obj: Identify):
+        setattr(self, self._IDENTIFY_TARGET, identify_obj.user_properties)
+
+
+class GroupIdentifyEvent(_IdentifyTargetEvent):
     """A special event that update properties of particular groups.
 
     Args:
@@ -795,6 +922,9 @@ class GroupIdentifyEvent(BaseEvent):
         identify_obj (Identify, optional): An Identify instance used to update the event's group_properties
     """
 
+    __slots__ = ()
+    _IDENTIFY_TARGET = "group_properties"
+
     def __init__(self, user_id: Optional[str] = None,
                  device_id: Optional[str] = None,
                  time: Optional[int] = None,
@@ -836,50 +966,17 @@ class GroupIdentifyEvent(BaseEvent):
                  callback: Optional[Callable[[EventOptions, int, Optional[str]], None]] = None,
                  identify_obj: Optional[Identify] = None):
         """The constructor of GroupIdentifyEvent"""
-        super().__init__(constants.GROUP_IDENTIFY_EVENT, user_id=user_id,
-                         device_id=device_id,
-                         time=time,
-                         event_properties=event_properties,
-                         user_properties=user_properties,
-                         groups=groups,
-                         group_properties=group_properties,
-                         app_version=app_version,
-                         platform=platform,
-                         os_name=os_name,
-                         os_version=os_version,
-                         device_brand=device_brand,
-                         device_manufacturer=device_manufacturer,
-                         device_model=device_model,
-                         carrier=carrier,
-                         country=country,
-                         region=region,
-                         city=city,
-                         dma=dma,
-                         language=language,
-                         price=price,
-                         quantity=quantity,
-                         revenue=revenue,
-                         product_id=product_id,
-                         revenue_type=revenue_type,
-                         location_lat=location_lat,
-                         location_lng=location_lng,
-                         ip=ip,
-                         idfa=idfa,
-                         idfv=idfv,
-                         adid=adid,
-                         android_id=android_id,
-                         event_id=event_id,
-                         session_id=session_id,
-                         insert_id=insert_id,
-                         plan=plan,
-                         ingestion_metadata=ingestion_metadata,
-                         partner_id=partner_id,
-                         callback=callback)
+        _init_base_event(self, constants.GROUP_IDENTIFY_EVENT, user_id, device_id, time, event_properties,
+                         user_properties, groups, group_properties, app_version, platform, os_name, os_version,
+                         device_brand, device_manufacturer, device_model, carrier, country, region, city, dma, language,
+                         price, quantity, revenue, product_id, revenue_type, location_lat, location_lng, ip, idfa, idfv,
+                         adid, android_id, event_id, session_id, insert_id, plan, ingestion_metadata, partner_id,
+                         callback)
         if identify_obj:
-            self.group_properties = identify_obj.user_properties
+            self._load_identify(identify_obj)
 
 
-class IdentifyEvent(BaseEvent):
+class IdentifyEvent(_IdentifyTargetEvent):
     """A special event that update properties of particular user.
 
     Args:
@@ -930,6 +1027,8 @@ class IdentifyEvent(BaseEvent):
         identify_obj (Identify, optional): An Identify instance used to update the event's user_properties
     """
 
+    __slots__ = ()
+
     def __init__(self, user_id: Optional[str] = None,
                  device_id: Optional[str] = None,
                  time: Optional[int] = None,
@@ -970,47 +1069,24 @@ class IdentifyEvent(BaseEvent):
                  partner_id: Optional[str] = None,
                  callback: Optional[Callable[[EventOptions, int, Optional[str]], None]] = None,
                  identify_obj: Optional[Identify] = None):
-        super().__init__(constants.IDENTIFY_EVENT, user_id=user_id,
-                         device_id=device_id,
-                         time=time,
-                         event_properties=event_properties,
-                         user_properties=user_properties,
-                         groups=groups,
-                         group_properties=group_properties,
-                         app_version=app_version,
-                         platform=platform,
-                         os_name=os_name,
-                         os_version=os_version,
-                         device_brand=device_brand,
-                         device_manufacturer=device_manufacturer,
-                         device_model=device_model,
-                         carrier=carrier,
-                         country=country,
-                         region=region,
-                         city=city,
-                         dma=dma,
-                         language=language,
-                         price=price,
-                         quantity=quantity,
-                         revenue=revenue,
-                         product_id=product_id,
-                         revenue_type=revenue_type,
-                         location_lat=location_lat,
-                         location_lng=location_lng,
-                         ip=ip,
-                         idfa=idfa,
-                         idfv=idfv,
-                         adid=adid,
-                         android_id=android_id,
-                         event_id=event_id,
-                         session_id=session_id,
-                         insert_id=insert_id,
-                         plan=plan,
-                         ingestion_metadata=ingestion_metadata,
-                         partner_id=partner_id,
-                         callback=callback)
+        _init_base_event(self, constants.IDENTIFY_EVENT, user_id, device_id, time, event_properties, user_properties,
+                         groups, group_properties, app_version, platform, os_name, os_version, device_brand,
+                         device_manufacturer, device_model, carrier, country, region, city, dma, language, price,
+                         quantity, revenue, product_id, revenue_type, location_lat, location_lng, ip, idfa, idfv, adid,
+                         android_id, event_id, session_id, insert_id, plan, ingestion_metadata, partner_id, callback)
         if identify_obj:
-            self.user_properties = identify_obj.user_properties
+            self._load_identify(identify_obj)
+
+
+REVENUE_KEY_MAPPING = {
+    "product_id": constants.REVENUE_PRODUCT_ID,
+    "quantity": constants.REVENUE_QUANTITY,
+    "price": constants.REVENUE_PRICE,
+    "revenue_type": constants.REVENUE_TYPE,
+    "receipt": constants.REVENUE_RECEIPT,
+    "receipt_sig": constants.REVENUE_RECEIPT_SIG,
+    "revenue": constants.REVENUE
+}
 
 
 class Revenue:
@@ -1035,6 +1111,8 @@ class Revenue:
         get_event_properties(): Return a dictionary of revenue instance data used as event_properties of RevenueEvent
     """
 
+    __slots__ = ("price", "quantity", "product_id", "revenue_type", "receipt", "receipt_sig", "properties", "revenue")
+
     def __init__(self, price: float,
                  quantity: int = 1,
                  product_id: Optional[str] = None,
@@ -1084,22 +1162,18 @@ class Revenue:
         return RevenueEvent(event_properties=self.get_event_properties())
 
     def get_event_properties(self):
-        """Return a dictionary of revenue instance data used as event_properties of RevenueEvent
+        """Return a dictionary of revenue instance data used as event_properties of RevenueEvent. Only top level of
+            properties is copied, nested values are shared with the Revenue instance.
 
         Returns:
           A dict object
         """
-        event_properties = {}
-        if self.properties:
-            event_properties = copy.deepcopy(self.properties)
-        event_properties.update({constants.REVENUE_PRODUCT_ID: self.product_id,
-                                 constants.REVENUE_QUANTITY: self.quantity,
-                                 constants.REVENUE_PRICE: self.price,
-                                 constants.REVENUE_TYPE: self.revenue_type,
-                                 constants.REVENUE_RECEIPT: self.receipt,
-                                 constants.REVENUE_RECEIPT_SIG: self.receipt_sig,
-                                 constants.REVENUE: self.revenue})
-        return {key: value for key, value in event_properties.items() if value is not None}
+        event_properties = dict(self.properties) if self.properties else {}
+        for key, property_key in REVENUE_KEY_MAPPING.items():
+            value = getattr(self, key)
+            if value is not None:
+                event_properties[property_key] = value
+        return event_properties
 
 
 class RevenueEvent(BaseEvent):
@@ -1153,6 +1227,13 @@ class RevenueEvent(BaseEvent):
         revenue_obj (Revenue, optional): An Revenue instance used to update the event's event_properties
     """
 
+    __slots__ = ()
+
+    def _load_revenue(self, revenue_obj: Revenue):
+        if not self.event_properties:
+            self.event_properties = {}
+        self.event_properties.update(revenue_obj.get_event_properties())
+
     def __init__(self, user_id: Optional[str] = None,
                  device_id: Optional[str] = None,
                  time: Optional[int] = None,
@@ -1194,49 +1275,13 @@ class RevenueEvent(BaseEvent):
                  callback: Optional[Callable[[EventOptions, int, Optional[str]], None]] = None,
                  revenue_obj: Optional[Revenue] = None):
         """The constructor of RevenueEvent class"""
-        super().__init__(constants.AMP_REVENUE_EVENT, user_id=user_id,
-                         device_id=device_id,
-                         time=time,
-                         event_properties=event_properties,
-                         user_properties=user_properties,
-                         groups=groups,
-                         group_properties=group_properties,
-                         app_version=app_version,
-                         platform=platform,
-                         os_name=os_name,
-                         os_version=os_version,
-                         device_brand=device_brand,
-                         device_manufacturer=device_manufacturer,
-                         device_model=device_model,
-                         carrier=carrier,
-                         country=country,
-                         region=region,
-                         city=city,
-                         dma=dma,
-                         language=language,
-                         price=price,
-                         quantity=quantity,
-                         revenue=revenue,
-                         product_id=product_id,
-                         revenue_type=revenue_type,
-                         location_lat=location_lat,
-                         location_lng=location_lng,
-                         ip=ip,
-                         idfa=idfa,
-                         idfv=idfv,
-                         adid=adid,
-                         android_id=android_id,
-                         event_id=event_id,
-                         session_id=session_id,
-                         insert_id=insert_id,
-                         plan=plan,
-                         ingestion_metadata=ingestion_metadata,
-                         partner_id=partner_id,
-                         callback=callback)
+        _init_base_event(self, constants.AMP_REVENUE_EVENT, user_id, device_id, time, event_properties, user_properties,
+                         groups, group_properties, app_version, platform, os_name, os_version, device_brand,
+                         device_manufacturer, device_model, carrier, country, region, city, dma, language, price,
+                         quantity, revenue, product_id, revenue_type, location_lat, location_lng, ip, idfa, idfv, adid,
+                         android_id, event_id, session_id, insert_id, plan, ingestion_metadata, partner_id, callback)
         if revenue_obj:
-            if not self.event_properties:
-                self.event_properties = {}
-            self.event_properties.update(revenue_obj.get_event_properties())
+            self._load_revenue(revenue_obj)
 
 
 def is_validate_properties(key, value):
@@ -1249,27 +1294,7 @@ def is_validate_properties(key, value):
     Returns:
          True if inputs are valid key-value pair, False otherwise.
     """
-    if not isinstance(key, str):
-        return False
-    if value is None:
-        return True
-    if isinstance(value, list):
-        result = True
-        for element in value:
-            if isinstance(element, list):
-                return False
-            if isinstance(element, dict):
-                result = result and is_validate_object(element)
-            elif not isinstance(element, (float, int, str)):
-                result = False
-            if not result:
-                break
-        return result
-    if isinstance(value, dict):
-        return is_validate_object(value)
-    if not isinstance(value, (bool, float, int, str, enum.Enum)):
-        return False
-    return True
+    return _is_validate_items(((key, value),))
 
 
 def is_validate_object(obj):
@@ -1281,7 +1306,47 @@ def is_validate_object(obj):
     Returns:
         True if obj is a valid property value, False otherwise.
     """
-    for key, value in obj.items():
-        if not is_validate_properties(key, value):
-            return False
+    return _is_validate_items(obj.items())
+
+
+def _is_validate_items(items):
+    """Check property key-value pairs with an explicit stack instead of recursion. Items of nested dictionaries are
+        pushed to the stack with their nesting depth and checked in later iterations. Values whose exact type is a
+        scalar property type are accepted with a set lookup before the isinstance checks. Dictionaries nested deeper
+        than constants.MAX_PROPERTY_DEPTH are rejected, as truncating and serializing them is recursive.
+
+    Args:
+        items: The key-value pairs of a property dictionary to be checked.
+
+    Returns:
+        True if all key-value pairs and their nested items are valid, False otherwise.
+    """
+    stack = [(items, 1)]
+    while stack:
+        items, depth = stack.pop()
+        for key, value in items:
+            if type(key) is not str and not isinstance(key, str):
+                return False
+            if type(value) in _SCALAR_VALUE_TYPE_SET:
+                continue
+            if isinstance(value, list):
+                if all(map(isinstance, value, repeat(LIST_ELEMENT_TYPES))):
+                    continue
+                for element in value:
+                    if isinstance(element, list):
+                        return False
+                    if isinstance(element, dict):
+                        if depth >= constants.MAX_PROPERTY_DEPTH:
+                            logger.error("Properties nested too deep. %s levels maximum.", constants.MAX_PROPERTY_DEPTH)
+                            return False
+                        stack.append((element.items(), depth + 1))
+                    elif not isinstance(element, LIST_ELEMENT_TYPES):
+                        return False
+            elif isinstance(value, dict):
+                if depth >= constants.MAX_PROPERTY_DEPTH:
+                    logger.error("Properties nested too deep. %s levels maximum.", constants.MAX_PROPERTY_DEPTH)
+                    return False
+                stack.append((value.items(), depth + 1))
+            elif not isinstance(value, PROPERTY_VALUE_TYPES):
+                return False
     return True
@@ -1,16 +1,57 @@
-import json
+import os
 from enum import Enum
 from socket import timeout
 from typing import Optional
-from urllib import request, response, error
+from urllib import request, response, error, parse
 
 from amplitude import constants
+from amplitude import utils
+
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
 
 JSON_HEADER = {
     "Content-Type": "application/json; charset=UTF-8",
     "Accept": "*/*"
 }
 
+# Keep-alive connections reused across flushes when urllib3 is installed and no proxy applies
+_POOL = None
+_POOL_PID = None
+
+
+def _get_pool():
+    """Return the urllib3 PoolManager of the current process. A forked process gets a new pool instead of sharing
+        the keep-alive connections of its parent.
+
+    Returns:
+        The PoolManager instance
+    """
+    global _POOL, _POOL_PID
+    pid = os.getpid()
+    if _POOL_PID != pid:
+        _POOL = urllib3.PoolManager(num_pools=4, maxsize=8, retries=False,
+                                    timeout=urllib3.Timeout(connect=constants.CONNECTION_TIMEOUT,
+                                                            read=constants.CONNECTION_TIMEOUT))
+        _POOL_PID = pid
+    return _POOL
+
+
+def _proxy_applies(url: str) -> bool:
+    """Check if urllib.request would send a request to url through a proxy, as configured by environment variables
+        like HTTP_PROXY and NO_PROXY or by system settings. The urllib3 pool doesn't use proxies.
+
+    Args:
+        url (str): The request url.
+
+    Returns:
+        True if a proxy applies to url, False otherwise.
+    """
+    parts = parse.urlsplit(url)
+    return parts.scheme in request.getproxies() and not request.proxy_bypass(parts.hostname or "")
+
 
 class HttpStatus(Enum):
     SUCCESS = 200
@@ -22,6 +63,14 @@ class HttpStatus(Enum):
     UNKNOWN = -1
 
 
+_STATUS_MAP = {
+    200: HttpStatus.SUCCESS,
+    408: HttpStatus.TIMEOUT,
+    413: HttpStatus.PAYLOAD_TOO_LARGE,
+    429: HttpStatus.TOO_MANY_REQUESTS
+}
+
+
 class Response:
 
     def __init__(self, status: HttpStatus = HttpStatus.UNKNOWN, body: Optional[dict] = None):
@@ -32,7 +81,10 @@ class Response:
             self.body = {}
 
     def parse(self, res: response):
-        res_body = json.loads(res.read().decode("utf8"))
+        return self.parse_body(res.read())
+
+    def parse_body(self, data: bytes):
+        res_body = utils.json_loads(data)
         self.code = res_body["code"]
         self.status = self.get_status(self.code)
         self.body = res_body
@@ -88,30 +140,24 @@ class Response:
         return False
 
     def invalid_or_silenced_index(self):
+        body = self.body
         result = set()
-        if self.events_with_missing_fields:
-            for field in self.events_with_missing_fields:
-                result.update(self.events_with_missing_fields[field])
-        if self.events_with_invalid_fields:
-            for field in self.events_with_invalid_fields:
-                result.update(self.events_with_invalid_fields[field])
-        if self.events_with_invalid_id_lengths:
-            for field in self.events_with_invalid_id_lengths:
-                result.update(self.events_with_invalid_id_lengths[field])
-        if self.silenced_events:
-            result.update(self.silenced_events)
+        for key in ("events_with_missing_fields", "events_with_invalid_fields", "events_with_invalid_id_lengths"):
+            indexes = body.get(key)
+            if indexes:
+                result.update(*indexes.values())
+        silenced_events = body.get("silenced_events")
+        if silenced_events:
+            result.update(silenced_events)
         return result
 
     @staticmethod
     def get_status(code: int) -> HttpStatus:
+        status = _STATUS_MAP.get(code)
+        if status is not None:
+            return status
         if 200 <= code < 300:
             return HttpStatus.SUCCESS
-        elif code == 429:
-            return HttpStatus.TOO_MANY_REQUESTS
-        elif code == 413:
-            return HttpStatus.PAYLOAD_TOO_LARGE
-        elif code == 408:
-            return HttpStatus.TIMEOUT
         elif 400 <= code < 500:
             return HttpStatus.INVALID_REQUEST
         elif code >= 500:
@@ -123,12 +169,13 @@ class HttpClient:
 
     @staticmethod
     def post(url: str, payload: bytes, header=None) -> Response:
+        if not header:
+            header = JSON_HEADER
+        if urllib3 is not None and not _proxy_applies(url):
+            return HttpClient._pool_post(url, payload, header)
         result = Response()
         try:
-            if not header:
-                req = request.Request(url, data=payload, headers=JSON_HEADER)
-            else:
-                req = request.Request(url, data=payload, headers=header)
+            req = request.Request(url, data=payload, headers=header)
             res = request.urlopen(req, timeout=constants.CONNECTION_TIMEOUT)
             result.parse(res)
         except timeout:
@@ -145,3 +192,29 @@ class HttpClient:
         except error.URLError as e:
             result.body = {'error': str(e.reason)}
         return result
+
+    @staticmethod
+    def _pool_post(url: str, payload: bytes, header) -> Response:
+        result = Response()
+        try:
+            res = _get_pool().urlopen("POST", url, body=payload, headers=header)
+        except urllib3.exceptions.NewConnectionError as e:
+            result.body = {'error': str(e)}
+            return result
+        except urllib3.exceptions.TimeoutError:
+            result.code = 408
+            result.status = HttpStatus.TIMEOUT
+            return result
+        except urllib3.exceptions.HTTPError as e:
+            result.body = {'error': str(e)}
+            return result
+        if 200 <= res.status < 300:
+            return result.parse_body(res.data)
+        try:
+            result.parse_body(res.data)
+        except:
+            result = Response()
+            result.code = res.status
+            result.status = Response.get_status(res.status)
+            result.body = {'error': res.reason}
+        return result
@@ -70,11 +70,13 @@ class ResponseProcessor:
                 self.log([event], res.code, message)
 
     def callback(self, events, code, message):
+        client_callback = self.configuration.callback if callable(self.configuration.callback) else None
         for event in events:
             try:
-                if callable(self.configuration.callback):
-                    self.configuration.callback(event, code, message)
-                event.callback(code, message)
+                if client_callback is not None:
+                    client_callback(event, code, message)
+                if event.event_callback is not None:
+                    event.callback(code, message)
             except Exception:
                 self.configuration.logger.exception(f"Error callback for event {event}")
     
@@ -1,8 +1,14 @@
+import json
 import logging
 import time
 
 from amplitude import constants
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(constants.LOGGER_NAME)
 
 
@@ -18,7 +24,8 @@ def current_milliseconds() -> int:
 def truncate(obj):
     """Truncate an object: Cut string values that exceed the maximum length limit. Return empty dict if number of
         items exceed maximum properties key limit. Truncate operation applies to dict and str type, values of
-        dict and elements of list.
+        dict and elements of list. Only nested dicts and lists are visited recursively, other values are left in
+        place unless they are strings exceeding the limit.
 
     Args:
          obj: The object to be truncated.
@@ -31,10 +38,70 @@ def truncate(obj):
             logger.error(f"Too many properties. {constants.MAX_PROPERTY_KEYS} maximum.")
             return {}
         for key, value in obj.items():
-            obj[key] = truncate(value)
+            if isinstance(value, str):
+                if len(value) > constants.MAX_STRING_LENGTH:
+                    obj[key] = value[:constants.MAX_STRING_LENGTH]
+            elif isinstance(value, (dict, list)):
+                obj[key] = truncate(value)
     elif isinstance(obj, list):
         for i, element in enumerate(obj):
-            obj[i] = truncate(element)
+            if isinstance(element, str):
+                if len(element) > constants.MAX_STRING_LENGTH:
+                    obj[i] = element[:constants.MAX_STRING_LENGTH]
+            elif isinstance(element, (dict, list)):
+                obj[i] = truncate(element)
     elif isinstance(obj, str):
         obj = obj[:constants.MAX_STRING_LENGTH]
     return obj
+
+
+def json_dumps(obj, sort_keys: bool = False) -> str:
+    """Serialize an object to a compact JSON string. Use orjson if it is installed, json module otherwise or when
+        orjson doesn't support the object.
+
+    Args:
+        obj: The object to be serialized.
+        sort_keys (bool, optional): True to sort keys of dictionaries in output. Default to False.
+
+    Returns:
+        The JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0).decode("utf8")
+        except TypeError:
+            pass
+    return json.dumps(obj, sort_keys=sort_keys, skipkeys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+def json_dumps_bytes(obj) -> bytes:
+    """Serialize an object to compact JSON encoded in UTF-8. Use orjson if it is installed, json module otherwise or
+        when orjson doesn't support the object. The json module escapes non-ASCII characters, so strings with lone
+        surrogates, which orjson rejects, are still encoded.
+
+    Args:
+        obj: The object to be serialized.
+
+    Returns:
+        The JSON bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, skipkeys=True, separators=(",", ":")).encode("utf8")
+
+
+def json_loads(data: bytes):
+    """Deserialize UTF-8 encoded JSON bytes. Use orjson if it is installed, json module otherwise.
+
+    Args:
+        data (bytes): The JSON document encoded in UTF-8.
+
+    Returns:
+        The deserialized object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf8"))
@@ -1,7 +1,7 @@
-import json
 from concurrent.futures import ThreadPoolExecutor
 from threading import Thread, RLock
 
+from amplitude import utils
 from amplitude.exception import InvalidAPIKeyError
 from amplitude.http_client import HttpClient
 from amplitude.processor import ResponseProcessor
@@ -51,17 +51,14 @@ class Workers:
             self.configuration.logger.error("Invalid API Key")
 
     def get_payload(self, events) -> bytes:
+        event_bodies = [event.get_event_body() for event in events]
         payload_body = {
             "api_key": self.configuration.api_key,
-            "events": []
+            "events": [event_body for event_body in event_bodies if event_body]
         }
-        for event in events:
-            event_body = event.get_event_body()
-            if event_body:
-                payload_body["events"].append(event_body)
         if self.configuration.options:
             payload_body["options"] = self.configuration.options
-        return json.dumps(payload_body, sort_keys=True).encode('utf8')
+        return utils.json_dumps_bytes(payload_body)
 
     def buffer_consumer(self):
         try:
@@ -1,4 +1,8 @@
+import copy
 import enum
+import inspect
+import pickle
+import sys
 import unittest
 from unittest.mock import MagicMock
 
@@ -21,6 +25,58 @@ class AmplitudeEventTestCase(unittest.TestCase):
         event.retry += 1
         self.assertEqual(1, event.retry)
 
+    def test_base_event_copy_keep_attributes_without_instance_dict(self):
+        event = IdentifyEvent(user_id="test_user", identify_obj=Identify().set("email", "test@test"),
+                              callback=MagicMock())
+        event.retry = 2
+        self.assertFalse(hasattr(event, "__dict__"))
+        event_copy = copy.deepcopy(event)
+        self.assertEqual(event.get_event_body(), event_copy.get_event_body())
+        self.assertEqual(2, event_copy.retry)
+        self.assertIsNotNone(event_copy.event_callback)
+
+    def test_fixed_type_event_constructor_signature(self):
+        base_parameters = list(inspect.signature(BaseEvent.__init__).parameters.values())
+        for event_cls, extra_arg in ((IdentifyEvent, "identify_obj"), (GroupIdentifyEvent, "identify_obj"),
+                                     (RevenueEvent, "revenue_obj")):
+            parameters = list(inspect.signature(event_cls.__init__).parameters.values())
+            self.assertEqual(f"{event_cls.__name__}.__init__", event_cls.__init__.__qualname__)
+            self.assertEqual([base_parameters[0]] + base_parameters[2:], parameters[:-1])
+            self.assertEqual(extra_arg, parameters[-1].name)
+
+    def test_base_event_pickle_keep_attributes_and_retry(self):
+        event = RevenueEvent(user_id="test_user", revenue_obj=Revenue(price=30.65, quantity=2),
+                             plan=Plan(branch="test_branch"))
+        event.retry = 3
+        event_copy = pickle.loads(pickle.dumps(event))
+        self.assertIsInstance(event_copy, RevenueEvent)
+        self.assertEqual(event.get_event_body(), event_copy.get_event_body())
+        self.assertEqual(3, event_copy.retry)
+        self.assertIsNone(event_copy.event_callback)
+
+    def test_base_event_copy_subclass_keep_slots_and_instance_dict(self):
+        class SlottedEvent(BaseEvent):
+            __slots__ = ("__source",)
+
+            def __init__(self, source):
+                super().__init__("test_event", user_id="test_user")
+                self.__source = source
+
+            @property
+            def source(self):
+                return self.__source
+
+        class CustomEvent(SlottedEvent):
+            pass
+
+        event = CustomEvent("test_source")
+        event.extra = "test_extra"
+        event_copy = copy.copy(event)
+        self.assertIsInstance(event_copy, CustomEvent)
+        self.assertEqual("test_source", event_copy.source)
+        self.assertEqual("test_extra", event_copy.extra)
+        self.assertEqual(event.get_event_body(), event_copy.get_event_body())
+
     def test_base_event_set_attributes_with_wrong_key_log_error(self):
         event = BaseEvent("test_event", user_id="test_user")
         with self.assertLogs(None, "ERROR") as cm:
@@ -30,6 +86,33 @@ class AmplitudeEventTestCase(unittest.TestCase):
             self.assertEqual(["ERROR:amplitude:Unexpected event property key: id_device"],
                              cm.output)
 
+    def test_base_event_set_non_property_attribute_log_error(self):
+        event = BaseEvent("test_event", user_id="test_user")
+        with self.assertLogs(None, "ERROR") as cm:
+            event["event_callback"] = "test_callback"
+            self.assertIsNone(event.event_callback)
+            self.assertEqual(["ERROR:amplitude:Unexpected event property key: event_callback"],
+                             cm.output)
+
+    def test_base_event_common_string_attributes_interned(self):
+        platform = "".join(["test", "_platform"])
+        event = BaseEvent("test_event", platform=platform, os_name="".join(["test", "_os"]))
+        event["country"] = "".join(["test", "_country"])
+        other_event = BaseEvent("test_event", platform="test_platform", os_name="test_os", country="test_country")
+        self.assertIs(other_event.platform, event.platform)
+        self.assertIs(other_event.os_name, event.os_name)
+        self.assertIs(other_event.country, event.country)
+        event["device_model"] = "".join(["test", "_model"])
+        self.assertIsNot(sys.intern("test_model"), event.device_model)
+
+    def test_base_event_set_attributes_with_none_value_success(self):
+        event = BaseEvent("test_event", user_id="test_user")
+        event["user_id"] = None
+        event["id_device"] = None
+        self.assertFalse("user_id" in event)
+        self.assertIsNone(event.user_id)
+        self.assertFalse("id_device" in event)
+
     def test_base_event_set_attributes_with_wrong_value_type_log_error(self):
         event = BaseEvent("test_event", user_id="test_user")
         with self.assertLogs(None, "ERROR") as cm:
@@ -39,11 +122,28 @@ class AmplitudeEventTestCase(unittest.TestCase):
             self.assertEqual(["ERROR:amplitude:Event property time expected <class 'int'> but received <class 'float'>."],
                              cm.output)
 
+    def test_base_event_set_int_value_to_float_attributes_success(self):
+        event = BaseEvent("test_event", user_id="test_user", price=3, location_lat=1)
+        event["revenue"] = 6
+        self.assertEqual({"event_type": "test_event", "user_id": "test_user", "price": 3, "revenue": 6,
+                          "location_lat": 1}, event.get_event_body())
+        with self.assertLogs(None, "ERROR") as cm:
+            event["location_lng"] = True
+            self.assertFalse("location_lng" in event)
+            self.assertEqual(["ERROR:amplitude:Event property location_lng expected <class 'float'> but received "
+                              "<class 'bool'>."], cm.output)
+
     def test_base_event_to_json_string_success(self):
         event = BaseEvent("test_event", user_id="test_user", event_id=10)
-        self.assertEqual('{"event_id": 10, "event_type": "test_event", "user_id": "test_user"}',
+        self.assertEqual('{"event_id":10,"event_type":"test_event","user_id":"test_user"}',
                          str(event))
 
+    def test_base_event_get_event_body_keys_sorted(self):
+        event = BaseEvent("test_event", user_id="test_user", device_id="test_device", price=1.0, product_id="test_id",
+                          event_properties={"test": True}, platform="test_platform")
+        event_body_keys = list(event.get_event_body())
+        self.assertEqual(sorted(event_body_keys), event_body_keys)
+
     def test_base_event_set_plan_attribute_success(self):
         event = BaseEvent("test_event", user_id="test_user")
         event["plan"] = Plan(branch="test_branch", version_id="v1.1")
@@ -87,6 +187,11 @@ class AmplitudeEventTestCase(unittest.TestCase):
         test_event.callback(200, "Test Message")
         callback_func.assert_not_called()
 
+    def test_callback_with_non_callable_callback_stored_as_none(self):
+        test_event = BaseEvent("test_event", callback="not_callable")
+        self.assertIsNone(test_event.event_callback)
+        test_event.callback(200, "Test Message")
+
     def test_base_event_get_event_body_success(self):
         class TestEnum(enum.Enum):
             ENUM1 = 'test'
@@ -127,6 +232,31 @@ class AmplitudeEventTestCase(unittest.TestCase):
         event["event_properties"] = {"test": ["4", {"test": True}]}
         self.assertTrue("event_properties" in event)
 
+    def test_base_event_set_deeply_nested_dict_event_attributes_success(self):
+        event = BaseEvent(event_type="test_event", user_id="test_user")
+        properties = {"test": "value"}
+        for i in range(constants.MAX_PROPERTY_DEPTH - 1):
+            properties = {"nested": [properties]} if i % 2 else {"nested": properties}
+        event["event_properties"] = properties
+        self.assertTrue("event_properties" in event)
+        self.assertEqual(properties, event.get_event_body()["event_properties"])
+        self.assertTrue(str(event))
+        properties["invalid"] = [[1]]
+        event["user_properties"] = properties
+        self.assertFalse("user_properties" in event)
+
+    def test_base_event_set_too_deeply_nested_dict_event_attributes_failed(self):
+        event = BaseEvent(event_type="test_event", user_id="test_user")
+        for nested in (lambda properties: {"nested": properties}, lambda properties: {"nested": [properties]}):
+            properties = {"test": "value"}
+            for i in range(constants.MAX_PROPERTY_DEPTH):
+                properties = nested(properties)
+            with self.assertLogs(None, "ERROR") as cm:
+                event["event_properties"] = properties
+            self.assertFalse("event_properties" in event)
+            self.assertEqual([f"ERROR:amplitude:Properties nested too deep. {constants.MAX_PROPERTY_DEPTH} levels "
+                              "maximum."], cm.output)
+
     def test_base_event_set_string_exceed_max_length_truncate(self):
         event = BaseEvent(event_type="test_event", user_id="test_user")
         expect_dict = {"event_type": "test_event", "user_id": "test_user"}
@@ -273,6 +403,19 @@ class AmplitudeEventTestCase(unittest.TestCase):
         self.assertEqual(event.event_type, constants.IDENTIFY_EVENT)
         self.assertEqual(expect_user_property, event.user_properties)
 
+    def test_identify_event_initialization_with_event_attributes_success(self):
+        identify_obj = Identify().set("set_test_1", "test")
+        event = IdentifyEvent("test_user", "test_device", 10, {"properties1": "test"}, identify_obj=identify_obj,
+                              platform="test_platform")
+        self.assertEqual({"event_type": constants.IDENTIFY_EVENT,
+                          "user_id": "test_user",
+                          "device_id": "test_device",
+                          "time": 10,
+                          "platform": "test_platform",
+                          "event_properties": {"properties1": "test"},
+                          "user_properties": {constants.IDENTITY_OP_SET: {"set_test_1": "test"}}},
+                         event.get_event_body())
+
     def test_group_identify_event_initialization_has_proper_event_type_group_properties(self):
         expect_group_property = {constants.IDENTITY_OP_SET: {"set_test_1": 15},
                                  constants.IDENTITY_OP_SET_ONCE: {"set_once_test": "test"},
@@ -340,6 +483,13 @@ class AmplitudeEventTestCase(unittest.TestCase):
                               revenue_type="test_revenue_type", properties=properties)
         self.assertEqual(expect_event_properties, revenue_obj.get_event_properties())
 
+    def test_revenue_get_event_properties_not_modify_properties(self):
+        properties = {"other_properties": "test"}
+        revenue_obj = Revenue(price=30.65, quantity=2, properties=properties)
+        event_properties = revenue_obj.get_event_properties()
+        self.assertIsNot(properties, event_properties)
+        self.assertEqual({"other_properties": "test"}, properties)
+
     def test_revenue_initialize_revenue_event_proper_event_attributes(self):
         expect_event_properties = {constants.REVENUE_PRICE: 30.65,
                                    constants.REVENUE_QUANTITY: 2,
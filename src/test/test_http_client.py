@@ -0,0 +1,128 @@
+import json
+import os
+import socket
+import socketserver
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import patch
+
+from amplitude import http_client
+from amplitude.http_client import HttpClient, Response, HttpStatus
+
+
+class MockServerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.server.requests.append(self.rfile.read(int(self.headers["Content-Length"])))
+        code, body = self.server.responses[self.path]
+        self.send_response(code)
+        if code == 302:
+            self.send_header("Location", "/success")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class MockServer(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class AmplitudeHttpClientTestCase(unittest.TestCase):
+
+    def test_response_get_status_success(self):
+        expected = {200: HttpStatus.SUCCESS, 204: HttpStatus.SUCCESS, 400: HttpStatus.INVALID_REQUEST,
+                    404: HttpStatus.INVALID_REQUEST, 408: HttpStatus.TIMEOUT, 413: HttpStatus.PAYLOAD_TOO_LARGE,
+                    429: HttpStatus.TOO_MANY_REQUESTS, 500: HttpStatus.FAILED, 503: HttpStatus.FAILED,
+                    302: HttpStatus.UNKNOWN, -1: HttpStatus.UNKNOWN}
+        for code, status in expected.items():
+            self.assertEqual(status, Response.get_status(code))
+
+    def test_response_invalid_or_silenced_index_success(self):
+        response = Response(HttpStatus.INVALID_REQUEST, {
+            "code": 400,
+            "events_with_missing_fields": {"event_type": [0, 3], "user_id": [3, 5]},
+            "events_with_invalid_fields": {"time": [1]},
+            "events_with_invalid_id_lengths": {},
+            "silenced_events": [7, 0]
+        })
+        self.assertEqual({0, 1, 3, 5, 7}, response.invalid_or_silenced_index())
+        self.assertEqual(set(), Response(HttpStatus.INVALID_REQUEST, {"code": 400}).invalid_or_silenced_index())
+
+    def test_proxy_applies_environment_proxy_success(self):
+        proxy_env = {key: "" for key in os.environ if key.lower() in ("http_proxy", "https_proxy", "no_proxy")}
+        with patch.dict(os.environ, proxy_env):
+            for key in proxy_env:
+                del os.environ[key]
+            self.assertFalse(http_client._proxy_applies("https://api2.amplitude.com/2/httpapi"))
+            os.environ["https_proxy"] = "http://127.0.0.1:3128"
+            self.assertTrue(http_client._proxy_applies("https://api2.amplitude.com/2/httpapi"))
+            self.assertFalse(http_client._proxy_applies("http://api2.amplitude.com/2/httpapi"))
+            os.environ["no_proxy"] = "amplitude.com"
+            self.assertFalse(http_client._proxy_applies("https://api2.amplitude.com/2/httpapi"))
+
+
+@unittest.skipIf(http_client.urllib3 is None, "urllib3 is not installed")
+class AmplitudeHttpClientPoolTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockServer(("127.0.0.1", 0), MockServerHandler)
+        self.server.requests = []
+        self.server.responses = {
+            "/success": (200, b'{"code":200,"events_ingested":1}'),
+            "/invalid": (400, json.dumps({"code": 400, "error": "Invalid request",
+                                          "events_with_invalid_fields": {"time": [0]}}).encode()),
+            "/bad_gateway": (502, b"<html>Bad Gateway</html>"),
+            "/redirect": (302, b"")
+        }
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_get_pool_replaced_after_fork_success(self):
+        pool = http_client._get_pool()
+        self.assertIs(pool, http_client._get_pool())
+        with patch("amplitude.http_client.os.getpid", return_value=os.getpid() + 1):
+            child_pool = http_client._get_pool()
+            self.assertIsNot(pool, child_pool)
+            self.assertIs(child_pool, http_client._get_pool())
+        self.assertIsNot(child_pool, http_client._get_pool())
+
+    def test_pool_post_parse_response_success(self):
+        for _ in range(2):
+            res = HttpClient._pool_post(self.url + "/success", b'{"events":[]}', http_client.JSON_HEADER)
+            self.assertEqual(HttpStatus.SUCCESS, res.status)
+            self.assertEqual(1, res.body["events_ingested"])
+        self.assertEqual([b'{"events":[]}', b'{"events":[]}'], self.server.requests)
+        res = HttpClient._pool_post(self.url + "/invalid", b"{}", http_client.JSON_HEADER)
+        self.assertEqual(HttpStatus.INVALID_REQUEST, res.status)
+        self.assertEqual({0}, res.invalid_or_silenced_index())
+
+    def test_pool_post_non_json_response_success(self):
+        res = HttpClient._pool_post(self.url + "/bad_gateway", b"{}", http_client.JSON_HEADER)
+        self.assertEqual(502, res.code)
+        self.assertEqual(HttpStatus.FAILED, res.status)
+        self.assertEqual({"error": "Bad Gateway"}, res.body)
+        res = HttpClient._pool_post(self.url + "/redirect", b"{}", http_client.JSON_HEADER)
+        self.assertEqual(302, res.code)
+        self.assertEqual(HttpStatus.UNKNOWN, res.status)
+
+    def test_pool_post_connection_error_success(self):
+        with socket.socket() as closed_socket:
+            closed_socket.bind(("127.0.0.1", 0))
+            port = closed_socket.getsockname()[1]
+        res = HttpClient._pool_post(f"http://127.0.0.1:{port}/success", b"{}", http_client.JSON_HEADER)
+        self.assertEqual(HttpStatus.UNKNOWN, res.status)
+        self.assertIn("error", res.body)
+
+
+if __name__ == '__main__':
+    unittest.main()
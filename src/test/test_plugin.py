@@ -1,4 +1,5 @@
 import unittest
+import uuid
 from unittest.mock import MagicMock
 
 from amplitude.plugin import AmplitudeDestinationPlugin, ContextPlugin, EventPlugin, DestinationPlugin
@@ -38,6 +39,15 @@ class AmplitudePluginTestCase(unittest.TestCase):
         self.assertTrue(isinstance(event.library, str))
         self.assertTrue(isinstance(event.plan, Plan))
 
+    def test_plugin_context_plugin_insert_id_uuid4_success(self):
+        context_plugin = ContextPlugin()
+        insert_ids = [context_plugin._new_insert_id() for _ in range(1000)]
+        self.assertEqual(1000, len(set(insert_ids)))
+        for insert_id in insert_ids:
+            self.assertEqual(insert_id, str(uuid.UUID(insert_id)))
+            self.assertEqual(4, uuid.UUID(insert_id).version)
+            self.assertEqual(uuid.RFC_4122, uuid.UUID(insert_id).variant)
+
     def test_plugin_event_plugin_process_event_success(self):
         plugin = EventPlugin(PluginType.BEFORE)
         event = BaseEvent("test_event", user_id="test_user")
@@ -50,6 +60,37 @@ class AmplitudePluginTestCase(unittest.TestCase):
         event = GroupIdentifyEvent()
         self.assertEqual(event, plugin.execute(event))
 
+    def test_plugin_event_plugin_dispatch_event_subclass_success(self):
+        class CustomRevenueEvent(RevenueEvent):
+            pass
+
+        class RecordPlugin(EventPlugin):
+            def __init__(self):
+                super().__init__(PluginType.ENRICHMENT)
+                self.handled = []
+
+            def track(self, event):
+                self.handled.append("track")
+                return event
+
+            def revenue(self, event):
+                self.handled.append("revenue")
+                return event
+
+            def identify(self, event):
+                self.handled.append("identify")
+                return event
+
+            def group_identify(self, event):
+                self.handled.append("group_identify")
+                return event
+
+        plugin = RecordPlugin()
+        for event in (BaseEvent("test_event"), CustomRevenueEvent(), RevenueEvent(), IdentifyEvent(),
+                      GroupIdentifyEvent()):
+            self.assertEqual(event, plugin.execute(event))
+        self.assertEqual(["track", "revenue", "revenue", "identify", "group_identify"], plugin.handled)
+
     def test_plugin_destination_plugin_add_remove_plugin_success(self):
         destination_plugin = DestinationPlugin()
         destination_plugin.timeline.configuration = Config()
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 
 from amplitude import utils, constants
 
@@ -39,6 +40,50 @@ class AmplitudeUtilsTestCase(unittest.TestCase):
             self.assertEqual({}, truncated_obj[3])
             self.assertFalse(truncated_obj[4])
 
+    def test_utils_truncate_nested_object_success(self):
+        long_string = "a" * 2000
+        obj = {"short": "abc", "number": 1, "nested": {"list": [long_string, {"key": long_string}]}}
+        truncated_obj = utils.truncate(obj)
+        self.assertIs(obj, truncated_obj)
+        self.assertEqual("abc", truncated_obj["short"])
+        self.assertEqual(1, truncated_obj["number"])
+        self.assertEqual(long_string[:constants.MAX_STRING_LENGTH], truncated_obj["nested"]["list"][0])
+        self.assertEqual(long_string[:constants.MAX_STRING_LENGTH], truncated_obj["nested"]["list"][1]["key"])
+
+    def test_utils_json_dumps_compact_sorted_string_success(self):
+        obj = {"b": [1, 2.5, None], "a": {"d": True, "c": "\u00e9"}}
+        expect_json = '{"a":{"c":"\u00e9","d":true},"b":[1,2.5,null]}'
+        self.assertEqual(expect_json, utils.json_dumps(obj, sort_keys=True))
+        with patch("amplitude.utils.orjson", None):
+            self.assertEqual(expect_json, utils.json_dumps(obj, sort_keys=True))
+
+    def test_utils_json_dumps_non_string_key_skipped(self):
+        obj = {"a": 1, (1, 2): 2}
+        self.assertEqual('{"a":1}', utils.json_dumps(obj))
+        with patch("amplitude.utils.orjson", None):
+            self.assertEqual('{"a":1}', utils.json_dumps(obj))
+
+    def test_utils_json_dumps_bytes_compact_utf8_success(self):
+        obj = {"a": ["\u00e9", 1.5, None], "b": {"c": False}}
+        expect_json = '{"a":["\u00e9",1.5,null],"b":{"c":false}}'.encode("utf8")
+        self.assertEqual(expect_json, utils.json_dumps_bytes(obj))
+        with patch("amplitude.utils.orjson", None):
+            self.assertEqual(b'{"a":["\\u00e9",1.5,null],"b":{"c":false}}', utils.json_dumps_bytes(obj))
+
+    def test_utils_json_dumps_bytes_lone_surrogate_success(self):
+        obj = {"event_properties": {"name": "bad\ud800"}}
+        expect_json = b'{"event_properties":{"name":"bad\\ud800"}}'
+        self.assertEqual(expect_json, utils.json_dumps_bytes(obj))
+        with patch("amplitude.utils.orjson", None):
+            self.assertEqual(expect_json, utils.json_dumps_bytes(obj))
+
+    def test_utils_json_loads_utf8_bytes_success(self):
+        data = '{"code":200,"error":"\u00e9","events":[1,2.5,null]}'.encode("utf8")
+        expect_obj = {"code": 200, "error": "\u00e9", "events": [1, 2.5, None]}
+        self.assertEqual(expect_obj, utils.json_loads(data))
+        with patch("amplitude.utils.orjson", None):
+            self.assertEqual(expect_obj, utils.json_loads(data))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -47,13 +47,20 @@ class AmplitudeWorkersTestCase(unittest.TestCase):
     def test_worker_get_payload_success(self):
         events = [BaseEvent("test_event1", "test_user"), BaseEvent("test_event2", "test_user")]
         self.workers.configuration.api_key = "TEST_API_KEY"
-        expect_payload = b'{"api_key": "TEST_API_KEY", "events": [{"event_type": "test_event1", "user_id": ' \
-                         b'"test_user"}, {"event_type": "test_event2", "user_id": "test_user"}]}'
+        expect_payload = b'{"api_key":"TEST_API_KEY","events":[{"event_type":"test_event1","user_id":' \
+                         b'"test_user"},{"event_type":"test_event2","user_id":"test_user"}]}'
         self.assertEqual(expect_payload, self.workers.get_payload(events))
         self.workers.configuration.min_id_length = 3
-        expect_payload = b'{"api_key": "TEST_API_KEY", "events": [{"event_type": "test_event1", "user_id": ' \
-                         b'"test_user"}, {"event_type": "test_event2", "user_id": "test_user"}], "options": {' \
-                         b'"min_id_length": 3}}'
+        expect_payload = b'{"api_key":"TEST_API_KEY","events":[{"event_type":"test_event1","user_id":' \
+                         b'"test_user"},{"event_type":"test_event2","user_id":"test_user"}],"options":{' \
+                         b'"min_id_length":3}}'
+        self.assertEqual(expect_payload, self.workers.get_payload(events))
+
+    def test_worker_get_payload_lone_surrogate_success(self):
+        events = [BaseEvent("test_event", "test_user", event_properties={"name": "bad\ud800"})]
+        self.workers.configuration.api_key = "TEST_API_KEY"
+        expect_payload = b'{"api_key":"TEST_API_KEY","events":[{"event_properties":{"name":"bad\\ud800"},' \
+                         b'"event_type":"test_event","user_id":"test_user"}]}'
         self.assertEqual(expect_payload, self.workers.get_payload(events))
 
     def test_worker_consume_storage_events_success(self):